@@ -23,19 +23,45 @@ Usage:
   python3 veille.py fetch ... | python3 dispatch.py [--profile NAME]
 """
 
-import html
+import io
 import json
 import os
 import pathlib
 import re as _re
-import subprocess
 import sys
-import urllib.request
+import threading
+from collections import defaultdict
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+try:
+    import orjson as _orjson  # optional accelerator, stdlib json otherwise
+except ImportError:
+    _orjson = None
+
 _SEP = os.sep
 
+# ---------------------------------------------------------------------------
+# Logging
+# ---------------------------------------------------------------------------
+
+
+def _log(msg: str) -> None:
+    """Write one diagnostic line to stderr.
+
+    Goes straight to the binary buffer in a single write, so lines from
+    concurrently running handlers never interleave. Encoded like print()
+    would: the stream's encoding, with backslashreplace for the rest.
+    """
+    line = msg + "\n"
+    buf = getattr(sys.stderr, "buffer", None)
+    if buf is None:
+        sys.stderr.write(line)
+        return
+    buf.write(line.encode(sys.stderr.encoding or "utf-8", "backslashreplace"))
+    buf.flush()
+
+
 # ---------------------------------------------------------------------------
 # Paths
 # ---------------------------------------------------------------------------
@@ -45,6 +71,10 @@ _SKILLS_DIR = pathlib.Path.home() / ".openclaw" / "workspace" / "skills"
 _OC_CONFIG  = pathlib.Path.home() / ".openclaw" / "openclaw.json"
 CONFIG_PATH = _CONFIG_DIR / "config.json"
 
+# Delegated skill CLIs
+_MAIL_SCRIPT = _SKILLS_DIR / "mail-client" / "scripts" / "mail.py"
+_NC_SCRIPT   = _SKILLS_DIR / "nextcloud-files" / "scripts" / "nextcloud.py"
+
 
 def _validate_skill_script(script_path: pathlib.Path, skill_name: str) -> bool:
     """Validate that a skill script path is under the expected skills directory.
@@ -58,14 +88,33 @@ def _validate_skill_script(script_path: pathlib.Path, skill_name: str) -> bool:
         resolved_str = str(resolved)
         skills_str = str(skills_resolved)
         if resolved_str != skills_str and not resolved_str.startswith(skills_str + _SEP):
-            print(f"[dispatch] BLOCKED: {skill_name} script path {resolved} "
-                  f"is outside {skills_resolved}", file=sys.stderr)
+            _log(f"[dispatch] BLOCKED: {skill_name} script path {resolved} "
+                 f"is outside {skills_resolved}")
             return False
     except (OSError, ValueError):
         return False
     return True
 
 
+# ---------------------------------------------------------------------------
+# JSON helpers (orjson when available, stdlib json otherwise)
+# ---------------------------------------------------------------------------
+
+
+def _json_load(fp):
+    """Parse JSON from a binary file object."""
+    if _orjson is not None:
+        return _orjson.loads(fp.read())
+    return json.load(fp)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes (non-ASCII kept as-is)."""
+    if _orjson is not None:
+        return _orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
 # ---------------------------------------------------------------------------
 # File output safety
 # ---------------------------------------------------------------------------
@@ -107,15 +156,14 @@ def _validate_output_path(file_path: str, config: dict) -> pathlib.Path | None:
     try:
         p = pathlib.Path(file_path).expanduser().resolve()
     except (OSError, ValueError):
-        print(f"[dispatch:file] BLOCKED: cannot resolve path {file_path!r}",
-              file=sys.stderr)
+        _log(f"[dispatch:file] BLOCKED: cannot resolve path {file_path!r}")
         return None
 
     p_str = str(p)
     for pattern in _BLOCKED_PATH_PATTERNS:
         if pattern in p_str:
-            print(f"[dispatch:file] BLOCKED: path {p} matches blocked "
-                  f"pattern {pattern!r}", file=sys.stderr)
+            _log(f"[dispatch:file] BLOCKED: path {p} matches blocked "
+                 f"pattern {pattern!r}")
             return None
 
     allowed_dirs = [_DEFAULT_ALLOWED_DIR.resolve()]
@@ -131,30 +179,29 @@ def _validate_output_path(file_path: str, config: dict) -> pathlib.Path | None:
         if p_str_full == a_str or p_str_full.startswith(a_str + _SEP):
             return p
 
-    print(f"[dispatch:file] BLOCKED: {p} is outside allowed directories "
-          f"{[str(d) for d in allowed_dirs]} - add to "
-          f"config.security.allowed_output_dirs to allow", file=sys.stderr)
+    _log(f"[dispatch:file] BLOCKED: {p} is outside allowed directories "
+         f"{[str(d) for d in allowed_dirs]} - add to "
+         f"config.security.allowed_output_dirs to allow")
     return None
 
 
 def _validate_file_content(text: str) -> bool:
     """Validate that digest content does not contain suspicious patterns."""
     if len(text.encode("utf-8")) > _MAX_OUTPUT_SIZE:
-        print(f"[dispatch:file] BLOCKED: content too large "
-              f"({len(text.encode('utf-8'))} bytes, max {_MAX_OUTPUT_SIZE})",
-              file=sys.stderr)
+        _log(f"[dispatch:file] BLOCKED: content too large "
+             f"({len(text.encode('utf-8'))} bytes, max {_MAX_OUTPUT_SIZE})")
         return False
 
     for pattern in _BLOCKED_CONTENT_PATTERNS:
         if pattern in text:
-            print(f"[dispatch:file] BLOCKED: content contains suspicious "
-                  f"pattern {pattern!r}", file=sys.stderr)
+            _log(f"[dispatch:file] BLOCKED: content contains suspicious "
+                 f"pattern {pattern!r}")
             return False
 
     m = _BLOCKED_CONTENT_RE.search(text)
     if m:
-        print(f"[dispatch:file] BLOCKED: content matches suspicious "
-              f"regex pattern {m.group()!r}", file=sys.stderr)
+        _log(f"[dispatch:file] BLOCKED: content matches suspicious "
+             f"regex pattern {m.group()!r}")
         return False
 
     return True
@@ -220,7 +267,7 @@ def _get_tz(config: dict):
         try:
             return ZoneInfo(tz_name)
         except (ZoneInfoNotFoundError, Exception):
-            print(f"[dispatch] unknown timezone '{tz_name}', using UTC", file=sys.stderr)
+            _log(f"[dispatch] unknown timezone '{tz_name}', using UTC")
 
     return timezone.utc
 
@@ -235,6 +282,14 @@ def _is_processed(data: dict) -> bool:
     return "categories" in data
 
 
+def _group_by_source(articles: list) -> list:
+    """Group raw-fetch articles by source; returns sorted (source, articles) pairs."""
+    by_src: defaultdict = defaultdict(list)
+    for a in articles:
+        by_src[a.get("source", "?")].append(a)
+    return sorted(by_src.items())
+
+
 def _featured_items(data: dict) -> list:
     """Return featured/highlighted articles - supports ghost_picks and featured keys."""
     return data.get("featured", data.get("ghost_picks", []))
@@ -245,17 +300,21 @@ def _featured_items(data: dict) -> list:
 # ---------------------------------------------------------------------------
 
 
-def format_recap(data: dict, lang: str = _DEFAULT_LANG, tz=timezone.utc) -> str:
+def format_recap(data: dict, lang: str = _DEFAULT_LANG, tz=timezone.utc,
+                 now_dt: datetime = None, processed: bool = None) -> str:
     """Short plain-text recap (Telegram or similar)."""
-    now = datetime.now(tz).strftime("%d/%m %H:%M")
+    now = (now_dt or datetime.now(tz)).strftime("%d/%m %H:%M")
     title = _t(lang, "recap_title")
-    if _is_processed(data):
+    if processed is None:
+        processed = _is_processed(data)
+    if processed:
         categories = data.get("categories", [])
-        count = sum(len(c.get("articles", [])) for c in categories)
+        arts_lists = [c.get("articles", ()) for c in categories]
+        count = sum(map(len, arts_lists))
         picks = _featured_items(data)
         lines = [f"*{title} - {now}*", f"{count} articles"]
-        for cat in categories:
-            n = len(cat.get("articles", []))
+        for cat, arts in zip(categories, arts_lists):
+            n = len(arts)
             if n:
                 lines.append(f"- {cat['name']}: {n}")
         if picks:
@@ -271,45 +330,55 @@ def format_recap(data: dict, lang: str = _DEFAULT_LANG, tz=timezone.utc) -> str:
     return "\n".join(lines)
 
 
-def format_digest_markdown(data: dict, lang: str = _DEFAULT_LANG, tz=timezone.utc) -> str:
+def format_digest_markdown(data: dict, lang: str = _DEFAULT_LANG, tz=timezone.utc,
+                           now_dt: datetime = None, processed: bool = None,
+                           by_src: list = None) -> str:
     """Full Markdown digest for Nextcloud or file."""
     date_fmt = _t(lang, "date_fmt")
-    now = datetime.now(tz).strftime(date_fmt)
+    now = (now_dt or datetime.now(tz)).strftime(date_fmt)
     title = _t(lang, "title")
     lines = [f"# {title} - {now}", ""]
+    append = lines.append
+    if processed is None:
+        processed = _is_processed(data)
 
-    if _is_processed(data):
+    if processed:
         for cat in data.get("categories", []):
             lines += [f"## {cat['name']}", ""]
             for a in cat.get("articles", []):
+                a_title, a_url, a_src = a["title"], a["url"], a["source"]
+                pub    = a.get("published", "")
                 reason = a.get("reason", "")
-                lines.append(f"- **[{a['title']}]({a['url']})**  ")
-                lines.append(f"  *{a['source']} - {a.get('published', '')}*  ")
+                append(f"- **[{a_title}]({a_url})**  ")
+                append(f"  *{a_src} - {pub}*  ")
                 if reason:
-                    lines.append(f"  {reason}")
-                lines.append("")
+                    append(f"  {reason}")
+                append("")
         picks = _featured_items(data)
         if picks:
             featured_label = _t(lang, "featured")
             lines += [f"## ✍️ {featured_label}", ""]
             for p in picks:
-                lines.append(f"- **[{p['title']}]({p['url']})**  ")
-                lines.append(f"  *{p['source']}* - {p.get('reason', '')}")
-                lines.append("")
+                p_title, p_url, p_src = p["title"], p["url"], p["source"]
+                reason = p.get("reason", "")
+                append(f"- **[{p_title}]({p_url})**  ")
+                append(f"  *{p_src}* - {reason}")
+                append("")
     else:
         articles = data.get("articles", [])
         skipped = data.get("skipped_url", 0) + data.get("skipped_topic", 0)
         filtered_str = _t(lang, "filtered", n=skipped)
         lines += [f"*{len(articles)} articles | {filtered_str}*", ""]
-        by_src: dict = {}
-        for a in articles:
-            by_src.setdefault(a.get("source", "?"), []).append(a)
-        for src, arts in sorted(by_src.items()):
+        if by_src is None:
+            by_src = _group_by_source(articles)
+        for src, arts in by_src:
             lines += [f"## {src}", ""]
             for a in arts:
-                lines.append(f"- **[{a['title']}]({a['url']})**  ")
-                lines.append(f"  *{a.get('published', '')}*")
-                lines.append("")
+                a_title, a_url = a["title"], a["url"]
+                pub = a.get("published", "")
+                append(f"- **[{a_title}]({a_url})**  ")
+                append(f"  *{pub}*")
+                append("")
 
     return "\n".join(lines)
 
@@ -321,111 +390,128 @@ MOIS_FR  = ["janvier", "fevrier", "mars", "avril", "mai", "juin",
              "juillet", "aout", "septembre", "octobre", "novembre", "decembre"]
 
 
+# Inline CSS shared by the HTML templates below ({accent}/{color} are filled
+# per section when the template is formatted)
+_STYLE_ROW_CELL      = "padding:0 0 14px 14px;border-left:3px solid {accent};"
+_STYLE_ROW_META      = ("font-size:11px;color:#9ca3af;margin-bottom:3px;"
+                        "text-transform:uppercase;letter-spacing:0.4px;")
+_STYLE_ROW_LINK      = ("font-size:14px;font-weight:600;color:#111827;"
+                        "text-decoration:none;line-height:1.4;display:block;")
+_STYLE_ROW_REASON    = "font-size:13px;color:#6b7280;margin-top:4px;line-height:1.5;"
+_STYLE_SECTION_CELL  = "padding:20px 0 12px 0;"
+_STYLE_SECTION_BAR   = ("display:inline-block;width:4px;height:16px;background:{accent};"
+                        "border-radius:2px;vertical-align:middle;")
+_STYLE_SECTION_LABEL = ("margin-left:10px;font-size:12px;font-weight:700;color:{color};"
+                        "text-transform:uppercase;letter-spacing:0.8px;vertical-align:middle;")
+_STYLE_SECTION_COUNT = "margin-left:6px;font-size:11px;color:#9ca3af;vertical-align:middle;"
+_STYLE_FEATURED_CELL = "padding:20px 0 12px 0;border-bottom:2px solid #f59e0b;"
+_STYLE_FEATURED_BODY = "background:#fffbeb;border-radius:6px;padding:4px 0;"
+
+_TABLE_OPEN_HTML = '<table width="100%" cellpadding="0" cellspacing="0">'
+
+# Per-article row, filled with already-escaped values
+_ROW_TMPL_HTML = (
+    '<tr><td style="' + _STYLE_ROW_CELL + '">'
+    '<div style="' + _STYLE_ROW_META + '">{source} &middot; {pub}</div>'
+    '<a href="{url}" style="' + _STYLE_ROW_LINK + '">{title}</a>'
+    '{reason_block}</td></tr>'
+)
+_REASON_TMPL_HTML = '<div style="' + _STYLE_ROW_REASON + '">{reason}</div>'
+
+# Section heading row + opening of the section's article table
+_SECTION_TMPL_HTML = (
+    '<tr><td style="{cell_style}">'
+    '<span style="' + _STYLE_SECTION_BAR + '"></span>'
+    '<span style="' + _STYLE_SECTION_LABEL + '">{label}</span>'
+    '{count_block}</td></tr>'
+    '<tr><td{body_style}>' + _TABLE_OPEN_HTML
+)
+_COUNT_TMPL_HTML = '<span style="' + _STYLE_SECTION_COUNT + '">({count})</span>'
+_SECTION_CLOSE_HTML = '</table></td></tr>'
+
+
 def _date_fr(dt=None) -> str:
     d = dt or datetime.now()
     return f"{JOURS_FR[d.weekday()]} {d.day} {MOIS_FR[d.month - 1]} {d.year}"
 
 
-def _article_rows(articles: list, accent: str) -> str:
-    rows = ""
-    for a in articles:
-        source  = html.escape(str(a.get("source", "")))
-        pub     = html.escape(str(a.get("published", "")))
-        title   = html.escape(str(a.get("title", "(sans titre)")))
-        url     = html.escape(str(a.get("url", "#")), quote=True)
-        reason  = html.escape(str(a.get("reason", "")))
-        rows += (
-            f'<tr><td style="padding:0 0 14px 14px;border-left:3px solid {accent};">'
-            f'<div style="font-size:11px;color:#9ca3af;margin-bottom:3px;'
-            f'text-transform:uppercase;letter-spacing:0.4px;">{source} &middot; {pub}</div>'
-            f'<a href="{url}" style="font-size:14px;font-weight:600;color:#111827;'
-            f'text-decoration:none;line-height:1.4;display:block;">{title}</a>'
-            + (f'<div style="font-size:13px;color:#6b7280;margin-top:4px;line-height:1.5;">{reason}</div>'
-               if reason else "")
-            + f'</td></tr>'
-        )
-    return rows
+# Characters html.escape() rewrites; strings without any pass through as-is
+_HTML_SPECIAL_RE = _re.compile(r"[&<>\"']")
 
 
-def format_digest_html(data: dict, lang: str = _DEFAULT_LANG, tz=timezone.utc) -> str:
-    """Full HTML digest for email - styled layout matching Jarvis email standard."""
-    now_dt   = datetime.now(tz)
-    today    = _date_fr(now_dt)
-    time_str = now_dt.strftime("%H:%M")
+def _make_escaper():
+    """Return an html.escape wrapper memoized for the lifetime of one digest.
+
+    Source names and published dates repeat across most rows, so escaping
+    each distinct string once is enough.
+    """
+    import html
 
-    sections = ""
+    cache: dict = {}
 
-    if _is_processed(data):
-        # Featured section (yellow accent)
-        picks = _featured_items(data)
-        if picks:
-            featured_label = _t(lang, "featured")
-            rows = _article_rows(picks, "#f59e0b")
-            sections += (
-                f'<tr><td style="padding:20px 0 12px 0;border-bottom:2px solid #f59e0b;">'
-                f'<span style="display:inline-block;width:4px;height:16px;background:#f59e0b;'
-                f'border-radius:2px;vertical-align:middle;"></span>'
-                f'<span style="margin-left:10px;font-size:12px;font-weight:700;color:#92400e;'
-                f'text-transform:uppercase;letter-spacing:0.8px;vertical-align:middle;">'
-                f'✍️ {html.escape(featured_label)}</span></td></tr>'
-                f'<tr><td style="background:#fffbeb;border-radius:6px;padding:4px 0;">'
-                f'<table width="100%" cellpadding="0" cellspacing="0">{rows}</table>'
-                f'</td></tr>'
-            )
+    def _e(value) -> str:
+        s = value if isinstance(value, str) else str(value)
+        v = cache.get(s)
+        if v is None:
+            v = cache[s] = html.escape(s) if _HTML_SPECIAL_RE.search(s) else s
+        return v
 
-        # Categories
-        for i, cat in enumerate(data.get("categories", [])):
-            arts = cat.get("articles", [])
-            if not arts:
-                continue
-            accent = _CATEGORY_COLORS[i % len(_CATEGORY_COLORS)]
-            name   = html.escape(str(cat.get("name", "")))
-            count  = len(arts)
-            rows   = _article_rows(arts, accent)
-            sections += (
-                f'<tr><td style="padding:20px 0 12px 0;">'
-                f'<span style="display:inline-block;width:4px;height:16px;background:{accent};'
-                f'border-radius:2px;vertical-align:middle;"></span>'
-                f'<span style="margin-left:10px;font-size:12px;font-weight:700;color:#374151;'
-                f'text-transform:uppercase;letter-spacing:0.8px;vertical-align:middle;">{name}</span>'
-                f'<span style="margin-left:6px;font-size:11px;color:#9ca3af;vertical-align:middle;">'
-                f'({count})</span></td></tr>'
-                f'<tr><td><table width="100%" cellpadding="0" cellspacing="0">{rows}</table></td></tr>'
-            )
-        total = sum(len(c.get("articles", [])) for c in data.get("categories", []))
-        subtitle = f'{total} articles · {len(data.get("categories", []))} categories'
+    return _e
+
+
+def _article_rows(buf: io.StringIO, articles: list, accent: str, _e) -> None:
+    """Write one table row per article into buf, escaping with _e."""
+    write = buf.write
+    for a in articles:
+        get     = a.get
+        source  = _e(get("source", ""))
+        pub     = _e(get("published", ""))
+        title   = _e(get("title", "(sans titre)"))
+        url     = _e(get("url", "#"))
+        reason  = _e(get("reason", ""))
+        write(_ROW_TMPL_HTML.format_map({
+            "accent":       accent,
+            "source":       source,
+            "pub":          pub,
+            "url":          url,
+            "title":        title,
+            "reason_block": _REASON_TMPL_HTML.format_map({"reason": reason}) if reason else "",
+        }))
+
+
+def format_digest_html(data: dict, lang: str = _DEFAULT_LANG, tz=timezone.utc,
+                       now_dt: datetime = None, processed: bool = None,
+                       by_src: list = None) -> str:
+    """Full HTML digest for email - styled layout matching Jarvis email standard.
+
+    The whole document is written into a single StringIO buffer so that large
+    digests do not pay for repeated intermediate string concatenation.
+    """
+    now_dt   = now_dt or datetime.now(tz)
+    today    = _date_fr(now_dt)
+    time_str = now_dt.strftime("%H:%M")
+
+    if processed is None:
+        processed = _is_processed(data)
+    if processed:
+        categories = data.get("categories", [])
+        arts_lists = [c.get("articles", ()) for c in categories]
+        total = sum(map(len, arts_lists))
+        subtitle = f'{total} articles · {len(categories)} categories'
     else:
         articles = data.get("articles", [])
         total    = data.get("count", len(articles))
         skipped  = data.get("skipped_url", 0) + data.get("skipped_topic", 0)
-        by_src: dict = {}
-        for a in articles:
-            by_src.setdefault(a.get("source", "?"), []).append(a)
-        for i, (src, arts) in enumerate(sorted(by_src.items())):
-            accent = _CATEGORY_COLORS[i % len(_CATEGORY_COLORS)]
-            rows   = _article_rows(arts, accent)
-            src_e  = html.escape(src)
-            sections += (
-                f'<tr><td style="padding:20px 0 12px 0;">'
-                f'<span style="display:inline-block;width:4px;height:16px;background:{accent};'
-                f'border-radius:2px;vertical-align:middle;"></span>'
-                f'<span style="margin-left:10px;font-size:12px;font-weight:700;color:#374151;'
-                f'text-transform:uppercase;letter-spacing:0.8px;vertical-align:middle;">{src_e}</span>'
-                f'</td></tr>'
-                f'<tr><td><table width="100%" cellpadding="0" cellspacing="0">{rows}</table></td></tr>'
-            )
         subtitle = f'{total} articles'
         if skipped:
             subtitle += f' · {skipped} filtres'
 
     html_title = _t(lang, "title")
     no_art     = _t(lang, "no_articles")
-    body       = sections or (
-        f'<tr><td style="color:#9ca3af;font-size:14px;padding:16px 0;">'
-        f'{html.escape(no_art)}</td></tr>'
-    )
 
-    return f"""<!DOCTYPE html>
+    _e  = _make_escaper()
+    buf = io.StringIO()
+    buf.write(f"""<!DOCTYPE html>
 <html lang="fr">
 <head>
   <meta charset="utf-8">
@@ -440,15 +526,74 @@ def format_digest_html(data: dict, lang: str = _DEFAULT_LANG, tz=timezone.utc) -
           <tr>
             <td style="padding:24px 32px 16px 32px;border-bottom:1px solid #f3f4f6;">
               <div style="font-size:11px;color:#9ca3af;text-transform:uppercase;letter-spacing:1px;margin-bottom:6px;">{today}</div>
-              <div style="font-size:22px;font-weight:800;color:#111827;">📡 {html.escape(html_title)}</div>
-              <div style="font-size:13px;color:#6b7280;margin-top:4px;">{html.escape(subtitle)}</div>
+              <div style="font-size:22px;font-weight:800;color:#111827;">📡 {_e(html_title)}</div>
+              <div style="font-size:13px;color:#6b7280;margin-top:4px;">{_e(subtitle)}</div>
             </td>
           </tr>
           <!-- Content -->
           <tr>
             <td style="padding:8px 32px 24px 32px;">
               <table width="100%" cellpadding="0" cellspacing="0">
-                {body}
+                """)
+    body_start = buf.tell()
+
+    if processed:
+        # Featured section (yellow accent)
+        picks = _featured_items(data)
+        if picks:
+            featured_label = _t(lang, "featured")
+            buf.write(_SECTION_TMPL_HTML.format_map({
+                "cell_style":  _STYLE_FEATURED_CELL,
+                "accent":      "#f59e0b",
+                "color":       "#92400e",
+                "label":       f"✍️ {_e(featured_label)}",
+                "count_block": "",
+                "body_style":  f' style="{_STYLE_FEATURED_BODY}"',
+            }))
+            _article_rows(buf, picks, "#f59e0b", _e)
+            buf.write(_SECTION_CLOSE_HTML)
+
+        # Categories
+        for i, (cat, arts) in enumerate(zip(categories, arts_lists)):
+            if not arts:
+                continue
+            accent = _CATEGORY_COLORS[i % len(_CATEGORY_COLORS)]
+            name   = _e(cat.get("name", ""))
+            count  = len(arts)
+            buf.write(_SECTION_TMPL_HTML.format_map({
+                "cell_style":  _STYLE_SECTION_CELL,
+                "accent":      accent,
+                "color":       "#374151",
+                "label":       name,
+                "count_block": _COUNT_TMPL_HTML.format_map({"count": count}),
+                "body_style":  "",
+            }))
+            _article_rows(buf, arts, accent, _e)
+            buf.write(_SECTION_CLOSE_HTML)
+    else:
+        if by_src is None:
+            by_src = _group_by_source(articles)
+        for i, (src, arts) in enumerate(by_src):
+            accent = _CATEGORY_COLORS[i % len(_CATEGORY_COLORS)]
+            src_e  = _e(src)
+            buf.write(_SECTION_TMPL_HTML.format_map({
+                "cell_style":  _STYLE_SECTION_CELL,
+                "accent":      accent,
+                "color":       "#374151",
+                "label":       src_e,
+                "count_block": "",
+                "body_style":  "",
+            }))
+            _article_rows(buf, arts, accent, _e)
+            buf.write(_SECTION_CLOSE_HTML)
+
+    if buf.tell() == body_start:
+        buf.write(
+            f'<tr><td style="color:#9ca3af;font-size:14px;padding:16px 0;">'
+            f'{_e(no_art)}</td></tr>'
+        )
+
+    buf.write(f"""
               </table>
             </td>
           </tr>
@@ -463,7 +608,46 @@ def format_digest_html(data: dict, lang: str = _DEFAULT_LANG, tz=timezone.utc) -
     </tr>
   </table>
 </body>
-</html>"""
+</html>""")
+    return buf.getvalue()
+
+
+_FORMATTERS = {
+    "recap":    format_recap,
+    "markdown": format_digest_markdown,
+    "html":     format_digest_html,
+}
+
+
+def _make_renderer(data: dict, lang: str = _DEFAULT_LANG, tz=timezone.utc,
+                   now_dt: datetime = None):
+    """Return render(kind) -> str that formats each kind at most once.
+
+    Shared by all handlers of a dispatch so that several outputs using the
+    same content type reuse a single rendering of the digest. Thread-safe,
+    since dispatch() runs handlers concurrently.
+    """
+    cache: dict = {}
+    lock = threading.Lock()
+    # Input shape is classified once; the raw-digest source grouping is
+    # built on first use and shared by the Markdown and HTML formatters.
+    processed = _is_processed(data)
+    by_src = None
+
+    def render(kind: str) -> str:
+        nonlocal by_src
+        with lock:
+            text = cache.get(kind)
+            if text is None:
+                kwargs: dict = {"processed": processed}
+                if kind != "recap" and not processed:
+                    if by_src is None:
+                        by_src = _group_by_source(data.get("articles", []))
+                    kwargs["by_src"] = by_src
+                text = cache[kind] = _FORMATTERS[kind](data, lang, tz, now_dt, **kwargs)
+        return text
+
+    return render
 
 
 # ---------------------------------------------------------------------------
@@ -471,19 +655,35 @@ def format_digest_html(data: dict, lang: str = _DEFAULT_LANG, tz=timezone.utc) -
 # ---------------------------------------------------------------------------
 
 
+_UNSET = object()
+_OC_TOKEN = _UNSET
+_OC_TOKEN_LOCK = threading.Lock()
+
+
 def _oc_telegram_token() -> str:
     """Read Telegram bot token from ~/.openclaw/openclaw.json (read-only).
 
     Cross-config read: this is the only file read outside the skill's own
     config directory. To avoid this read entirely, set 'bot_token' explicitly
-    in the telegram_bot output config.
+    in the telegram_bot output config. The file is read at most once per
+    process, however many Telegram outputs are configured.
     """
+    global _OC_TOKEN
+    with _OC_TOKEN_LOCK:
+        if _OC_TOKEN is _UNSET:
+            _OC_TOKEN = _read_oc_telegram_token()
+        return _OC_TOKEN
+
+
+def _read_oc_telegram_token() -> str:
+    """Uncached read behind _oc_telegram_token()."""
     if not _OC_CONFIG.exists():
         return ""
     try:
-        print(f"[dispatch:telegram] reading bot token from {_OC_CONFIG} "
-              f"(set bot_token in output config to skip this)", file=sys.stderr)
-        d = json.loads(_OC_CONFIG.read_text(encoding="utf-8"))
+        _log(f"[dispatch:telegram] reading bot token from {_OC_CONFIG} "
+             f"(set bot_token in output config to skip this)")
+        with _OC_CONFIG.open("rb") as f:
+            d = _json_load(f)
         return d.get("channels", {}).get("telegram", {}).get("botToken", "")
     except Exception:
         return ""
@@ -494,79 +694,168 @@ def _oc_telegram_token() -> str:
 # ---------------------------------------------------------------------------
 
 
-def _out_telegram(cfg: dict, data: dict, lang: str = _DEFAULT_LANG, tz=timezone.utc) -> bool:
+_TG_HOST = "api.telegram.org"
+_TG_CONN = None
+_TG_LOCK = threading.Lock()
+
+
+def _tg_connect():
+    """Open an HTTPS connection to the Bot API, tunnelling through the
+    HTTPS proxy from the environment (HTTPS_PROXY / NO_PROXY) like urllib."""
+    import http.client
+    import urllib.request
+
+    proxy = urllib.request.getproxies().get("https")
+    if not proxy or urllib.request.proxy_bypass(_TG_HOST):
+        return http.client.HTTPSConnection(_TG_HOST, timeout=10)
+
+    import base64
+    from urllib.parse import unquote, urlsplit
+
+    parts = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    headers = {}
+    if parts.username:
+        cred = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+        headers["Proxy-Authorization"] = "Basic " + base64.b64encode(cred.encode()).decode("ascii")
+    conn = http.client.HTTPSConnection(parts.hostname, parts.port, timeout=10)
+    conn.set_tunnel(_TG_HOST, headers=headers)
+    return conn
+
+
+def _tg_send(token: str, payload: bytes) -> dict:
+    """POST a sendMessage payload and return the decoded API response.
+
+    The HTTPS connection is kept open at module level so that several
+    Telegram outputs (or repeated dispatches in one process) share a single
+    TLS handshake. A reused connection dropped by the server is reopened
+    and the request retried once.
+    """
+    import http.client
+
+    global _TG_CONN
+    with _TG_LOCK:
+        while True:
+            reused = _TG_CONN is not None
+            if not reused:
+                _TG_CONN = _tg_connect()
+            try:
+                _TG_CONN.request("POST", f"/bot{token}/sendMessage", body=payload,
+                                 headers={"Content-Type": "application/json"})
+                resp = _TG_CONN.getresponse()
+                body = resp.read()
+            except (http.client.HTTPException, ConnectionError) as e:
+                _TG_CONN.close()
+                _TG_CONN = None
+                if not reused:
+                    raise
+                _log(f"[dispatch:telegram] connection dropped ({e!r}), reconnecting")
+                continue
+            except Exception:
+                _TG_CONN.close()
+                _TG_CONN = None
+                raise
+            try:
+                return _json_load(io.BytesIO(body))
+            except ValueError:
+                # Non-JSON reply (e.g. a gateway error page): report the status
+                raise RuntimeError(f"HTTP Error {resp.status}: {resp.reason}") from None
+
+
+def _out_telegram(cfg: dict, data: dict, lang: str = _DEFAULT_LANG, tz=timezone.utc,
+                  now_dt: datetime = None, render=None) -> bool:
     """Send to Telegram via Bot API."""
+    render = render or _make_renderer(data, lang, tz, now_dt)
     token = cfg.get("bot_token") or _oc_telegram_token()
     chat_id = str(cfg.get("chat_id", ""))
     if not token:
-        print("[dispatch:telegram] bot_token not found - set in output config or configure Telegram in OpenClaw", file=sys.stderr)
+        _log("[dispatch:telegram] bot_token not found - set in output config or configure Telegram in OpenClaw")
         return False
     if not chat_id:
-        print("[dispatch:telegram] chat_id required", file=sys.stderr)
+        _log("[dispatch:telegram] chat_id required")
         return False
 
     content = cfg.get("content", "recap")
-    text = format_recap(data, lang, tz) if content == "recap" else format_digest_markdown(data, lang, tz)
+    text = render("recap" if content == "recap" else "markdown")
 
-    payload = json.dumps({
+    payload = _json_dumps({
         "chat_id": chat_id,
         "text": text,
         "parse_mode": "Markdown",
         "disable_web_page_preview": True,
-    }).encode()
-    req = urllib.request.Request(
-        f"https://api.telegram.org/bot{token}/sendMessage",
-        data=payload,
-        headers={"Content-Type": "application/json"},
-    )
+    })
     try:
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            result = json.loads(resp.read())
+        result = _tg_send(token, payload)
         if result.get("ok"):
-            print("[dispatch:telegram] OK", file=sys.stderr)
+            _log("[dispatch:telegram] OK")
             return True
-        print(f"[dispatch:telegram] API error: {result.get('description','?')}", file=sys.stderr)
+        _log(f"[dispatch:telegram] API error: {result.get('description','?')}")
         return False
     except Exception as e:
-        print(f"[dispatch:telegram] error: {e}", file=sys.stderr)
+        _log(f"[dispatch:telegram] error: {e}")
         return False
 
 
-def _out_mail(cfg: dict, data: dict, lang: str = _DEFAULT_LANG, tz=timezone.utc) -> bool:
+def _out_mail(cfg: dict, data: dict, lang: str = _DEFAULT_LANG, tz=timezone.utc,
+              now_dt: datetime = None, render=None) -> bool:
     """Send via mail-client skill CLI, fallback to raw SMTP."""
+    import subprocess
+
+    render = render or _make_renderer(data, lang, tz, now_dt)
     mail_to = cfg.get("mail_to", "")
     if not mail_to:
-        print("[dispatch:mail-client] mail_to required", file=sys.stderr)
+        _log("[dispatch:mail-client] mail_to required")
+        return False
+
+    # Bail out before rendering (HTML is the costliest format) when no
+    # delivery path is available at all.
+    mail_script = _MAIL_SCRIPT
+    use_skill = mail_script.exists() and _validate_skill_script(mail_script, "mail-client")
+    if not use_skill and not _smtp_configured(cfg):
+        _log("[dispatch:mail-client] mail-client skill not installed and no SMTP "
+             "fallback configured (smtp_host/smtp_user/smtp_pass)")
         return False
 
     date_fmt = _t(lang, "date_fmt")
-    now = datetime.now(tz).strftime(date_fmt)
+    now = (now_dt or datetime.now(tz)).strftime(date_fmt)
     subject = cfg.get("subject", f"{_t(lang, 'title')} - {now}")
     content = cfg.get("content", "full_digest")
-    body_plain = format_recap(data, lang, tz) if content == "recap" else format_digest_markdown(data, lang, tz)
-    body_html  = None if content == "recap" else format_digest_html(data, lang, tz)
+    body_plain = render("recap" if content == "recap" else "markdown")
+    body_html  = None if content == "recap" else render("html")
 
     # Try mail-client skill
-    mail_script = _SKILLS_DIR / "mail-client" / "scripts" / "mail.py"
-    if mail_script.exists() and _validate_skill_script(mail_script, "mail-client"):
+    if use_skill:
         cmd = [sys.executable, str(mail_script), "send",
                "--to", mail_to, "--subject", subject, "--body", body_plain]
+        stdin_html = None
         if body_html:
-            cmd += ["--html", body_html]
+            # Large HTML digests can hit ARG_MAX as an argv string; skills that
+            # support it can read the body from stdin instead (opt-in).
+            if cfg.get("html_stdin"):
+                cmd.append("--html-stdin")
+                stdin_html = body_html
+            else:
+                cmd += ["--html", body_html]
         try:
-            r = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            r = subprocess.run(cmd, input=stdin_html, stdout=subprocess.DEVNULL,
+                               stderr=subprocess.PIPE, text=True, timeout=30)
             if r.returncode == 0:
-                print("[dispatch:mail-client] OK", file=sys.stderr)
+                _log("[dispatch:mail-client] OK")
                 return True
-            print(f"[dispatch:mail-client] skill error: {r.stderr[:200]}", file=sys.stderr)
+            _log(f"[dispatch:mail-client] skill error: {r.stderr[:200]}")
         except Exception as e:
-            print(f"[dispatch:mail-client] skill call error: {e}", file=sys.stderr)
-        print("[dispatch:mail-client] falling back to SMTP config", file=sys.stderr)
+            _log(f"[dispatch:mail-client] skill call error: {e}")
+        _log("[dispatch:mail-client] falling back to SMTP config")
 
     # SMTP fallback
     return _smtp_fallback(cfg, subject, body_plain, body_html, tz=tz)
 
 
+def _smtp_configured(cfg: dict) -> bool:
+    """True if the output config has everything the SMTP fallback needs."""
+    return all([cfg.get("smtp_host"), cfg.get("smtp_user"),
+                cfg.get("smtp_pass"), cfg.get("mail_to")])
+
+
 def _smtp_fallback(cfg: dict, subject: str, body_plain: str, body_html: str = None, tz=timezone.utc) -> bool:
     """Raw SMTP send when mail-client skill is unavailable."""
     import smtplib
@@ -582,8 +871,8 @@ def _smtp_fallback(cfg: dict, subject: str, body_plain: str, body_html: str = No
     from_    = cfg.get("mail_from", user)
     to_      = cfg.get("mail_to", "")
 
-    if not all([host, user, password, to_]):
-        print("[dispatch:smtp-fallback] missing smtp_host/smtp_user/smtp_pass/mail_to in output config", file=sys.stderr)
+    if not _smtp_configured(cfg):
+        _log("[dispatch:smtp-fallback] missing smtp_host/smtp_user/smtp_pass/mail_to in output config")
         return False
 
     msg = MIMEMultipart("alternative")
@@ -602,26 +891,30 @@ def _smtp_fallback(cfg: dict, subject: str, body_plain: str, body_html: str = No
             s.ehlo(); s.starttls(context=ctx); s.ehlo()
             s.login(user, password)
             s.sendmail(from_, [to_], msg.as_string())
-        print("[dispatch:smtp-fallback] OK", file=sys.stderr)
+        _log("[dispatch:smtp-fallback] OK")
         return True
     except Exception as e:
-        print(f"[dispatch:smtp-fallback] error: {e}", file=sys.stderr)
+        _log(f"[dispatch:smtp-fallback] error: {e}")
         return False
 
 
-def _out_nextcloud(cfg: dict, data: dict, lang: str = _DEFAULT_LANG, tz=timezone.utc) -> bool:
+def _out_nextcloud(cfg: dict, data: dict, lang: str = _DEFAULT_LANG, tz=timezone.utc,
+                   now_dt: datetime = None, render=None) -> bool:
     """Write to Nextcloud via nextcloud skill CLI (append mode with date separator)."""
+    import subprocess
+
+    render = render or _make_renderer(data, lang, tz, now_dt)
     nc_path = cfg.get("path", "")
     if not nc_path:
-        print("[dispatch:nextcloud] path required", file=sys.stderr)
+        _log("[dispatch:nextcloud] path required")
         return False
 
     content = cfg.get("content", "full_digest")
-    text = format_recap(data, lang, tz) if content == "recap" else format_digest_markdown(data, lang, tz)
+    text = render("recap" if content == "recap" else "markdown")
 
-    nc_script = _SKILLS_DIR / "nextcloud-files" / "scripts" / "nextcloud.py"
+    nc_script = _NC_SCRIPT
     if not nc_script.exists():
-        print(f"[dispatch:nextcloud] skill not installed ({nc_script})", file=sys.stderr)
+        _log(f"[dispatch:nextcloud] skill not installed ({nc_script})")
         return False
     if not _validate_skill_script(nc_script, "nextcloud-files"):
         return False
@@ -629,8 +922,7 @@ def _out_nextcloud(cfg: dict, data: dict, lang: str = _DEFAULT_LANG, tz=timezone
     mode = cfg.get("mode", "append")
 
     if mode == "append":
-        now = datetime.now(tz)
-        date_str = now.strftime("%Y-%m-%d %H:%M")
+        date_str = (now_dt or datetime.now(tz)).strftime("%Y-%m-%d %H:%M")
         separator = f"\n\n---\n\n## {date_str}\n\n"
         text = separator + text
         cmd = [sys.executable, str(nc_script), "write", nc_path, "--content", text, "--append"]
@@ -638,23 +930,26 @@ def _out_nextcloud(cfg: dict, data: dict, lang: str = _DEFAULT_LANG, tz=timezone
         cmd = [sys.executable, str(nc_script), "write", nc_path, "--content", text]
 
     try:
-        r = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        r = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                           text=True, timeout=30)
         if r.returncode == 0:
             action = "appended to" if mode == "append" else "written to"
-            print(f"[dispatch:nextcloud] {action} {nc_path} OK", file=sys.stderr)
+            _log(f"[dispatch:nextcloud] {action} {nc_path} OK")
             return True
-        print(f"[dispatch:nextcloud] error: {r.stderr[:200]}", file=sys.stderr)
+        _log(f"[dispatch:nextcloud] error: {r.stderr[:200]}")
         return False
     except Exception as e:
-        print(f"[dispatch:nextcloud] error: {e}", file=sys.stderr)
+        _log(f"[dispatch:nextcloud] error: {e}")
         return False
 
 
-def _out_file(cfg: dict, data: dict, lang: str = _DEFAULT_LANG, tz=timezone.utc) -> bool:
+def _out_file(cfg: dict, data: dict, lang: str = _DEFAULT_LANG, tz=timezone.utc,
+              now_dt: datetime = None, render=None) -> bool:
     """Write digest to a local file."""
+    render = render or _make_renderer(data, lang, tz, now_dt)
     file_path = cfg.get("path", "")
     if not file_path:
-        print("[dispatch:file] path required", file=sys.stderr)
+        _log("[dispatch:file] path required")
         return False
 
     global_config = cfg.get("_global_config", {})
@@ -663,7 +958,7 @@ def _out_file(cfg: dict, data: dict, lang: str = _DEFAULT_LANG, tz=timezone.utc)
         return False
 
     content = cfg.get("content", "full_digest")
-    text = format_recap(data, lang, tz) if content == "recap" else format_digest_markdown(data, lang, tz)
+    text = render("recap" if content == "recap" else "markdown")
 
     if not _validate_file_content(text):
         return False
@@ -671,10 +966,10 @@ def _out_file(cfg: dict, data: dict, lang: str = _DEFAULT_LANG, tz=timezone.utc)
     try:
         p.parent.mkdir(parents=True, exist_ok=True)
         p.write_text(text, encoding="utf-8")
-        print(f"[dispatch:file] written to {p} OK", file=sys.stderr)
+        _log(f"[dispatch:file] written to {p} OK")
         return True
     except Exception as e:
-        print(f"[dispatch:file] error: {e}", file=sys.stderr)
+        _log(f"[dispatch:file] error: {e}")
         return False
 
 
@@ -689,57 +984,90 @@ _HANDLERS = {
     "file":         _out_file,
 }
 
+_MAX_WORKERS = 8
+
 # ---------------------------------------------------------------------------
 # Main dispatch function
 # ---------------------------------------------------------------------------
 
 
+def _resolve_outputs(config: dict, profile: str = None) -> list:
+    """Return the output list for profile (or config['outputs']), logging when empty."""
+    if profile:
+        outputs = config.get("profiles", {}).get(profile, [])
+        if not outputs:
+            _log(f"[dispatch] profile '{profile}' not found or empty")
+    else:
+        outputs = config.get("outputs", [])
+
+    if not outputs:
+        _log("[dispatch] No outputs configured. Add 'outputs' to ~/.openclaw/config/veille/config.json")
+    return outputs
+
+
 def dispatch(data: dict, config: dict, profile: str = None) -> dict:
     """
     Dispatch data to all enabled outputs.
     If profile is given, use config['profiles'][profile] instead of config['outputs'].
     Returns {"ok": [...], "fail": [...], "skip": [...]}.
     """
-    if profile:
-        outputs = config.get("profiles", {}).get(profile, [])
-        if not outputs:
-            print(f"[dispatch] profile '{profile}' not found or empty", file=sys.stderr)
-    else:
-        outputs = config.get("outputs", [])
+    outputs = _resolve_outputs(config, profile)
 
     results: dict = {"ok": [], "fail": [], "skip": []}
 
     if not outputs:
-        print("[dispatch] No outputs configured. Add 'outputs' to ~/.openclaw/config/veille/config.json", file=sys.stderr)
         return results
 
     # Resolve shared lang + tz from config
     lang = config.get("language", _DEFAULT_LANG)
     if lang not in _STRINGS:
-        print(f"[dispatch] unknown language '{lang}', falling back to '{_DEFAULT_LANG}'", file=sys.stderr)
+        _log(f"[dispatch] unknown language '{lang}', falling back to '{_DEFAULT_LANG}'")
         lang = _DEFAULT_LANG
     tz = _get_tz(config)
+    # Single timestamp shared by every output of this dispatch
+    now_dt = datetime.now(tz)
+
+    render = _make_renderer(data, lang, tz, now_dt)
 
+    jobs = []
     for out in outputs:
         out_type = out.get("type", "")
         if not out.get("enabled", True):
-            print(f"[dispatch] {out_type}: skipped (disabled)", file=sys.stderr)
+            _log(f"[dispatch] {out_type}: skipped (disabled)")
             results["skip"].append(out_type)
             continue
         handler = _HANDLERS.get(out_type)
         if not handler:
-            print(f"[dispatch] unknown output type: {out_type!r}", file=sys.stderr)
+            _log(f"[dispatch] unknown output type: {out_type!r}")
             results["skip"].append(out_type)
             continue
         out["_global_config"] = config
-        ok = handler(out, data, lang=lang, tz=tz)
+        jobs.append((out_type, handler, out))
+
+    # Handlers are I/O-bound and independent: run them concurrently, but
+    # collect results in config order so the report stays deterministic.
+    # A single job runs inline: a pool would only add thread startup.
+    if len(jobs) == 1:
+        out_type, handler, out = jobs[0]
+        ok = handler(out, data, lang=lang, tz=tz, now_dt=now_dt, render=render)
         results["ok" if ok else "fail"].append(out_type)
+    elif jobs:
+        # Imported lazily: keeps concurrent.futures off the cold-start path
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(jobs))) as ex:
+            futures = [
+                (out_type, ex.submit(handler, out, data, lang=lang, tz=tz,
+                                     now_dt=now_dt, render=render))
+                for out_type, handler, out in jobs
+            ]
+            for out_type, fut in futures:
+                results["ok" if fut.result() else "fail"].append(out_type)
 
     # Audit summary
     total = len(results["ok"]) + len(results["fail"]) + len(results["skip"])
-    print(f"[dispatch] audit: {total} outputs processed "
-          f"(ok={results['ok']}, fail={results['fail']}, skip={results['skip']})",
-          file=sys.stderr)
+    _log(f"[dispatch] audit: {total} outputs processed "
+         f"(ok={results['ok']}, fail={results['fail']}, skip={results['skip']})")
 
     return results
 
@@ -758,21 +1086,33 @@ def main():
     parser.add_argument("--profile", default=None, help="Named output profile")
     args = parser.parse_args()
 
-    try:
-        data = json.loads(sys.stdin.read())
-    except json.JSONDecodeError as e:
-        print(f"[dispatch] invalid JSON on stdin: {e}", file=sys.stderr)
-        sys.exit(1)
-
     config: dict = {}
     if CONFIG_PATH.exists():
         try:
-            config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+            with CONFIG_PATH.open("rb") as f:
+                config = _json_load(f)
         except Exception as e:
-            print(f"[dispatch] could not read config: {e}", file=sys.stderr)
+            _log(f"[dispatch] could not read config: {e}")
+
+    # Nothing to dispatch to: skip parsing the (possibly large) stdin, but
+    # still drain it so an upstream producer never hits a broken pipe.
+    if not _resolve_outputs(config, args.profile):
+        try:
+            while sys.stdin.buffer.read(1 << 16):
+                pass
+        except (OSError, ValueError):
+            pass
+        print(_json_dumps({"dispatched": {"ok": [], "fail": [], "skip": []}}).decode("utf-8"))
+        return
+
+    try:
+        data = _json_load(sys.stdin.buffer)
+    except ValueError as e:
+        _log(f"[dispatch] invalid JSON on stdin: {e}")
+        sys.exit(1)
 
     results = dispatch(data, config, profile=args.profile)
-    print(json.dumps({"dispatched": results}, ensure_ascii=False, indent=2))
+    print(_json_dumps({"dispatched": results}).decode("utf-8"))
 
     if results.get("fail"):
         sys.exit(1)
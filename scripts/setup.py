@@ -31,11 +31,17 @@ Actions du wizard cron :
   - L agent lit cron.json + references/cron_prompt.md et cree le cron OpenClaw
 """
 
-import argparse
 import json
+import os
 import sys
+import tempfile
 from pathlib import Path
 
+try:
+    import orjson as _orjson  # optional accelerator, stdlib json otherwise
+except ImportError:
+    _orjson = None
+
 # ---- Paths ------------------------------------------------------------------
 
 SKILL_DIR    = Path(__file__).resolve().parent.parent
@@ -70,18 +76,55 @@ def _confirm(prompt: str, interactive: bool) -> bool:
         return False
 
 
+def _json_loads(raw: bytes):
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes (same layout with or without orjson)."""
+    if _orjson is not None:
+        return _orjson.dumps(data, option=_orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 def _load_json(path: Path) -> dict:
     if path.exists():
         try:
-            return json.loads(path.read_text(encoding="utf-8"))
+            return _json_loads(path.read_bytes())
         except Exception as e:
             print(f"[WARN] Could not read {path}: {e}", file=sys.stderr)
     return {}
 
 
-def _save_json(path: Path, data: dict):
+def _save_json(path: Path, data: dict) -> bool:
+    """Atomic write: write to temp file then rename to prevent corruption.
+
+    No fsync: durability is left to the OS page cache flush, the rename
+    alone guarantees readers never see a half-written file. The write is
+    skipped when the file already holds the same bytes.
+    Returns True if the file was (re)written.
+    """
+    content = _json_dumps(data)
+    try:
+        if path.read_bytes() == content:
+            return False
+    except OSError:
+        pass
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp, str(path))
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return True
 
 
 def _real_sources(sources: dict) -> dict:
@@ -185,59 +228,84 @@ def run_setup(interactive: bool = True):
 # ---- Source management ------------------------------------------------------
 
 
-def _build_catalog(example_cfg: dict, user_cfg: dict) -> list:
+def _parse_example_catalog(example_cfg: dict) -> dict:
     """
-    Construit le catalogue complet des sources avec leur statut.
-    Retourne une liste de dicts :
-      { "name": str, "url": str, "active": bool, "category": str }
+    Aplatit le catalogue d'exemple en structures immuables :
+      names / urls / categories : tuples paralleles, une entree par source
+                                  (sources puis sources_disabled, sans doublon)
+      sources_layout / disabled_layout : ((cle, valeur, est_marqueur), ...)
+                                  pour reconstruire les blocs dans l'ordre
+      source_names / disabled_names : frozensets des noms de chaque bloc
     """
-    catalog = []
-    current_category = "General"
-
-    example_sources  = example_cfg.get("sources", {})
-    example_disabled = example_cfg.get("sources_disabled", {})
-    user_sources     = user_cfg.get("sources", {})
-    user_disabled    = user_cfg.get("sources_disabled", {})
-
-    # Active in user config: source is in user sources (non-comment keys)
-    user_active_names = set(_real_sources(user_sources).keys())
-
-    # All known sources = example sources + example disabled + user custom
-    all_known: dict = {}
+    names: list = []
+    urls: list = []
+    categories: list = []
+    seen: set = set()
 
-    for name, val in example_sources.items():
-        if name.startswith("_comment"):
+    sources_layout: list = []
+    current_category = "General"
+    for name, val in example_cfg.get("sources", {}).items():
+        marker = name.startswith("_comment")
+        sources_layout.append((name, val, marker))
+        if marker:
             # Extract category label from comment value
             current_category = val.strip("- ").strip()
             continue
-        all_known[name] = {"url": val, "category": current_category}
+        if name not in seen:
+            seen.add(name)
+            names.append(name)
+            urls.append(val)
+            categories.append(current_category)
 
+    disabled_layout: list = []
     current_category = "Autres"
-    for name, val in example_disabled.items():
+    for name, val in example_cfg.get("sources_disabled", {}).items():
+        marker = name.startswith("_")
+        disabled_layout.append((name, val, marker))
         if name.startswith("_comment"):
             current_category = val.strip("- ").strip()
+        if marker or name in seen:
             continue
-        if name.startswith("_"):
-            continue
-        if name not in all_known:
-            all_known[name] = {"url": val, "category": current_category}
-
-    # User custom sources not in example
-    for name, val in _real_sources(user_sources).items():
-        if name not in all_known:
-            all_known[name] = {"url": val, "category": "Custom"}
-    for name, val in _real_sources(user_disabled).items():
-        if name not in all_known:
-            all_known[name] = {"url": val, "category": "Custom"}
-
-    # Build catalog list
-    for name, info in all_known.items():
-        catalog.append({
-            "name":     name,
-            "url":      info["url"],
-            "active":   name in user_active_names,
-            "category": info["category"],
-        })
+        seen.add(name)
+        names.append(name)
+        urls.append(val)
+        categories.append(current_category)
+
+    return {
+        "names":           tuple(names),
+        "urls":            tuple(urls),
+        "categories":      tuple(categories),
+        "sources_layout":  tuple(sources_layout),
+        "disabled_layout": tuple(disabled_layout),
+        "source_names":    frozenset(k for k, _, m in sources_layout if not m),
+        "disabled_names":  frozenset(k for k, _, m in disabled_layout if not m),
+    }
+
+
+def _build_catalog(example: dict, user_cfg: dict) -> list:
+    """
+    Construit le catalogue complet des sources avec leur statut.
+    example est le catalogue pre-parse (_parse_example_catalog).
+    Retourne une liste de dicts :
+      { "name": str, "url": str, "active": bool, "category": str }
+    """
+    user_sources  = _real_sources(user_cfg.get("sources", {}))
+    user_disabled = _real_sources(user_cfg.get("sources_disabled", {}))
+
+    # Example sources, active if present in user sources (non-comment keys)
+    catalog = [
+        {"name": name, "url": url, "active": name in user_sources, "category": category}
+        for name, url, category in zip(example["names"], example["urls"], example["categories"])
+    ]
+
+    # User custom sources not in example (kept in config order)
+    known = set(example["names"])
+    for custom in (user_sources, user_disabled):
+        for name, val in custom.items():
+            if name not in known:
+                known.add(name)
+                catalog.append({"name": name, "url": val,
+                                "active": name in user_sources, "category": "Custom"})
 
     return catalog
 
@@ -253,7 +321,7 @@ def _display_catalog(catalog: list):
         print(f"  {i + 1:2d}. {status} {entry['name']}")
 
 
-def _apply_catalog(catalog: list, example_cfg: dict, user_cfg: dict) -> dict:
+def _apply_catalog(catalog: list, example: dict, user_cfg: dict) -> dict:
     """
     Reconstruit sources et sources_disabled a partir du catalogue.
     Preserve les cles _comment_* de l'exemple dans sources.
@@ -265,33 +333,27 @@ def _apply_catalog(catalog: list, example_cfg: dict, user_cfg: dict) -> dict:
 
     # Rebuild sources: keep _comment_ keys in order from example, add active
     new_sources: dict = {}
-    example_sources = example_cfg.get("sources", {})
-    # Preserve comment keys and order from example, include active sources
-    for name, val in example_sources.items():
-        if name.startswith("_comment"):
+    for name, val, marker in example["sources_layout"]:
+        if marker:
             new_sources[name] = val
         elif name in active_names:
             new_sources[name] = all_urls[name]
 
-    # Custom active sources not in example
-    for name in active_names:
-        if name not in new_sources:
-            new_sources[name] = all_urls[name]
+    # Custom active sources not in example (catalog order)
+    custom_active = active_names - example["source_names"]
+    new_sources.update({e["name"]: e["url"] for e in catalog if e["name"] in custom_active})
 
     # Rebuild sources_disabled
     new_disabled: dict = {}
-    example_disabled = example_cfg.get("sources_disabled", {})
-    for name, val in example_disabled.items():
-        if name.startswith("_"):
+    for name, val, marker in example["disabled_layout"]:
+        if marker:
             new_disabled[name] = val
-            continue
-        if name in inactive_names:
+        elif name in inactive_names:
             new_disabled[name] = all_urls[name]
 
-    # Custom inactive sources not in example disabled
-    for name in inactive_names:
-        if name not in new_disabled:
-            new_disabled[name] = all_urls[name]
+    # Custom inactive sources not in example disabled (catalog order)
+    custom_inactive = inactive_names - example["disabled_names"]
+    new_disabled.update({e["name"]: e["url"] for e in catalog if e["name"] in custom_inactive})
 
     result = dict(user_cfg)
     result["sources"] = new_sources
@@ -313,10 +375,13 @@ def run_manage_sources():
             sys.exit(1)
         print("Using config.example.json as base.\n")
 
+    # config.example.json is parsed once: the catalog is derived from it and
+    # it doubles as the base config when config.json is missing.
     example_cfg = _load_json(EXAMPLE_FILE)
+    example     = _parse_example_catalog(example_cfg)
     user_cfg    = _load_json(CONFIG_FILE) if CONFIG_FILE.exists() else dict(example_cfg)
 
-    catalog = _build_catalog(example_cfg, user_cfg)
+    catalog = _build_catalog(example, user_cfg)
 
     print(f"\n  Config : {CONFIG_FILE}")
     print("  Statut : [ON] = active, [off] = desactivee")
@@ -324,6 +389,10 @@ def run_manage_sources():
     print("           'q' pour sauvegarder et quitter")
     print("           'r' pour reafficher la liste")
 
+    # Toggles only touch the in-memory catalog; config.json is rebuilt and
+    # written once, on quit, and only if something changed (or it is missing).
+    catalog_dirty = not CONFIG_FILE.exists()
+
     while True:
         print()
         _display_catalog(catalog)
@@ -343,7 +412,6 @@ def run_manage_sources():
             continue
 
         # Parse numbers
-        changed = False
         for token in raw.replace(",", " ").split():
             try:
                 idx = int(token) - 1
@@ -352,18 +420,24 @@ def run_manage_sources():
                     name = catalog[idx]["name"]
                     status = "ON" if catalog[idx]["active"] else "off"
                     print(f"  -> {name}: {status}")
-                    changed = True
+                    catalog_dirty = True
                 else:
                     print(f"  [WARN] Numero {token} hors plage (1-{len(catalog)})")
             except ValueError:
                 print(f"  [WARN] '{token}' n'est pas un nombre")
 
-    # Save
-    updated = _apply_catalog(catalog, example_cfg, user_cfg)
-    _save_json(CONFIG_FILE, updated)
+    # Save (toggling back to the saved state leaves the file untouched)
+    if catalog_dirty:
+        updated = _apply_catalog(catalog, example, user_cfg)
+        catalog_dirty = _save_json(CONFIG_FILE, updated)
 
     active_count = sum(1 for e in catalog if e["active"])
     print()
+    if not catalog_dirty:
+        print(f"  Aucun changement : {active_count} sources actives ({CONFIG_FILE} inchange)")
+        print()
+        return
+
     print(f"  Sauvegarde : {active_count} sources actives -> {CONFIG_FILE}")
     print()
 
@@ -799,7 +873,7 @@ def run_manage_outputs():
                 oc_cfg_path = Path.home() / ".openclaw" / "openclaw.json"
                 if oc_cfg_path.exists():
                     try:
-                        oc = json.loads(oc_cfg_path.read_text(encoding="utf-8"))
+                        oc = _json_loads(oc_cfg_path.read_bytes())
                         token = oc.get("channels", {}).get("telegram", {}).get("botToken", "")
                         if token:
                             print("  OK: bot_token auto-detected from OpenClaw config")
@@ -866,6 +940,16 @@ def cleanup():
 
 
 def main():
+    # Fast path for the common scripted invocations: no argparse import
+    argv = sys.argv[1:]
+    if argv == ["--non-interactive"]:
+        run_setup(interactive=False)
+        return
+    if argv == ["--manage-sources"]:
+        run_manage_sources()
+        return
+
+    import argparse
     parser = argparse.ArgumentParser(description="OpenClaw veille - setup wizard")
     parser.add_argument("--manage-sources", action="store_true",
                         help="Gestion interactive des sources RSS (activer/desactiver)")